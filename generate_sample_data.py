@@ -42,7 +42,7 @@ Features:
 - Generates data for multiple metrics
 - Creates realistic patterns (daily cycles, trends, anomalies)
 - Adds random tags with configurable cardinality
-- Supports different output formats (CSV, JSON)
+- Supports different output formats (CSV, JSON, NDJSON, Parquet)
 
 Usage:
   python generate_sample_data.py [options]
@@ -53,22 +53,28 @@ Options:
   --interval SECONDS       Interval between data points in seconds (default: 60)
   --metrics NUM            Number of metrics to generate (default: 10)
   --hosts NUM              Number of hosts to simulate (default: 5)
-  --output FORMAT          Output format: csv or json (default: csv)
-  --output-file PATH       Path to output file (default: time_series_data.csv/json)
+  --output FORMAT          Output format: csv, json, ndjson or parquet (default: csv)
+  --output-file PATH       Path to output file (default: time_series_data.[format])
   --seed NUM               Random seed for reproducibility (default: 42)
+  --workers NUM            Number of processes generating data in parallel (default: CPU count)
 """
 
 import argparse
-import csv
-import datetime
 import json
-import math
+import multiprocessing as mp
 import os
 import random
 import sys
 import time
 from typing import Dict, List, Tuple, Union
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the kernels below then run as plain Python
+    njit = None
+
 # Metric templates with reasonable value ranges and patterns
 METRIC_TEMPLATES = [
     {
@@ -169,6 +175,18 @@ TAG_CATEGORIES = {
 }
 
 
+def _jit(signature: str):
+    """
+    Compile a scalar loop kernel with numba when it is installed.
+
+    Giving the signature up front compiles (or loads from cache) at import time, so worker
+    processes never compile on first call.
+    """
+    def decorate(func):
+        return njit(signature, cache=True, fastmath=True)(func) if njit is not None else func
+    return decorate
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Generate sample time series data')
@@ -191,8 +209,8 @@ def parse_args():
                         help='Number of hosts to simulate (default: 35)')
 
     # Output settings
-    parser.add_argument('--output', type=str, choices=['csv', 'json'], default='csv',
-                        help='Output format: csv or json (default: csv)')
+    parser.add_argument('--output', type=str, choices=['csv', 'json', 'ndjson', 'parquet'], default='csv',
+                        help='Output format: csv, json, ndjson or parquet (default: csv)')
     parser.add_argument('--output-file', type=str, default=None,
                         help='Path to output file (default: time_series_data.[format])')
 
@@ -200,6 +218,10 @@ def parse_args():
     parser.add_argument('--seed', type=int, default=42,
                         help='Random seed for reproducibility (default: 42)')
 
+    # Performance settings
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes generating data in parallel (default: CPU count)')
+
     return parser.parse_args()
 
 
@@ -221,7 +243,7 @@ def generate_metrics(num_metrics: int) -> List[Dict]:
 
     if metrics_needed <= len(METRIC_TEMPLATES):
         metrics.extend(METRIC_TEMPLATES[:metrics_needed])
-        return metrics
+        return _resolve_patterns(metrics)
 
     # If we need more than the templates, we'll add all templates
     metrics.extend(METRIC_TEMPLATES)
@@ -243,7 +265,24 @@ def generate_metrics(num_metrics: int) -> List[Dict]:
 
         metrics.append(variation)
 
-    return metrics[:num_metrics]
+    return _resolve_patterns(metrics[:num_metrics])
+
+
+def _resolve_patterns(metrics: List[Dict]) -> List[Dict]:
+    """
+    Copy the metric configurations, resolving each pattern name to its pattern_id and
+    computing the value range once.
+
+    Unknown patterns fall back to random values.
+    """
+    return [
+        dict(
+            metric,
+            pattern_id=PATTERN_IDS.get(metric["pattern"], PATTERN_IDS["random"]),
+            value_range=metric["max"] - metric["min"]
+        )
+        for metric in metrics
+    ]
 
 
 def generate_host_configs(num_hosts: int) -> List[Dict]:
@@ -254,166 +293,326 @@ def generate_host_configs(num_hosts: int) -> List[Dict]:
         num_hosts: Number of hosts to generate
 
     Returns:
-        List of host configuration dictionaries
+        List of host configuration dictionaries, with the tags both as strings and, for the
+        categories drawn from TAG_CATEGORIES, as indices into the category's values
     """
-    hosts = []
+    host_ids = [f"server{i:02d}" for i in range(1, num_hosts + 1)]
+    hosts = [{"id": host_id, "tags": {"host": host_id}, "tags_idx": {}} for host_id in host_ids]
 
-    for i in range(1, num_hosts + 1):
-        host_id = f"server{i:02d}"
+    # Add random tags from categories, drawing each category for all hosts at once
+    for category, values in TAG_CATEGORIES.items():
+        if category == "host":
+            continue  # Already added
 
-        # Generate tags for this host
-        tags = {"host": host_id}
+        # Skip high cardinality tags here - they'll be added per metric
+        if category in ["customer_id", "request_id"]:
+            continue
 
-        # Add random tags from categories
-        for category, values in TAG_CATEGORIES.items():
-            if category == "host":
-                continue  # Already added
+        # Not every host will have every tag: 80% chance to have this tag category
+        present = [random.random() < 0.8 for _ in range(num_hosts)]
+        picks = random.choices(range(len(values)), k=num_hosts)
 
-            # Skip high cardinality tags here - they'll be added per metric
-            if category in ["customer_id", "request_id"]:
-                continue
+        for host, has_tag, value_index in zip(hosts, present, picks):
+            if has_tag:
+                host["tags_idx"][category] = value_index
+                host["tags"][category] = values[value_index]
 
-            # Not every host will have every tag
-            if random.random() < 0.8:  # 80% chance to have this tag category
-                tags[category] = random.choice(values)
+    return hosts
 
-        hosts.append({
-            "id": host_id,
-            "tags": tags
-        })
 
-    return hosts
+# Every series takes one bulk draw of uniform [0, 1) rows: as many as its pattern uses,
+# followed by the rows for noise and anomalies
+NOISE_DRAWS = 4
+
+
+def _uniform(low: float, high: float, draws: np.ndarray) -> np.ndarray:
+    """Scale uniform [0, 1) draws to [low, high)."""
+    return low + (high - low) * draws
+
+
+def _daily_cycle(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                 value_range: float, draws: np.ndarray) -> np.ndarray:
+    """Higher during work hours (9am-5pm), lower at night with some fluctuation."""
+    work_hours = (hours >= 9) & (hours < 17)
+
+    # Peak in the middle of the day
+    work_progress = (hours - 9) / 8.0  # 0.0 to 1.0 during work hours
+    daily_factor = 0.5 + 0.5 * np.sin(np.pi * (work_progress - 0.5))
+    day_value = min_val + value_range * (0.6 + 0.4 * daily_factor)
+    night_value = min_val + value_range * _uniform(0.1, 0.4, draws[0])
+
+    return np.where(work_hours, day_value, night_value)
+
+
+@_jit("float64(float64, float64, boolean, float64, float64, float64)")
+def _finish_value(base_value, noise, anomaly, anomaly_value, min_val, max_val):
+    """
+    Turn a base value into the value written, as generate_series does for a whole series: add
+    the noise or take the anomaly, clip to bounds and round to 2 decimal places.
+    """
+    value = anomaly_value if anomaly else base_value + noise
+    value = min(max_val, max(min_val, value))
+    return np.rint(value * 100.0) / 100.0
+
+
+@_jit("float64[:](float64, float64[:], float64[:], float64[:], float64, float64, float64, boolean, "
+      "float64[:], boolean[:], float64[:])")
+def _drift_kernel(first, deltas, reset_values, reset_rolls, min_val, max_val, soft_limit, rising,
+                  noise, anomalies, anomaly_values):
+    """
+    Accumulate deltas from the last value written, starting at first and restarting from
+    reset_values at the hard limit or, past soft_limit, on a 1% reset roll.
+    """
+    n = len(deltas)
+    values = np.empty(n)
+    base_value = first
+
+    for i in range(n):
+        if i > 0:
+            base_value = values[i - 1] + deltas[i]
+            if rising:
+                reset = base_value > max_val or (base_value > soft_limit and reset_rolls[i] < 0.01)
+            else:
+                reset = base_value < min_val or (base_value < soft_limit and reset_rolls[i] < 0.01)
+            if reset:
+                base_value = reset_values[i]
+        values[i] = _finish_value(base_value, noise[i], anomalies[i], anomaly_values[i], min_val, max_val)
+
+    return values
+
+
+@_jit("float64[:](float64[:], float64[:], float64[:], float64[:], float64[:], float64, float64, float64, "
+      "float64[:], boolean[:], float64[:])")
+def _bursty_kernel(low_values, burst_values, walk, start_rolls, continue_rolls, min_val, max_val,
+                   burst_threshold, noise, anomalies, anomaly_values):
+    """
+    Random-walk bursts over a low baseline, starting and ending them on the given rolls; an
+    anomaly spike in the last value written starts a burst too.
+    """
+    n = len(low_values)
+    values = np.empty(n)
+
+    for i in range(n):
+        if i > 0 and values[i - 1] > burst_threshold:
+            # We're in a burst, 80% chance to continue burst
+            if continue_rolls[i] < 0.8:
+                base_value = min(max_val, max(min_val, values[i - 1] + walk[i]))
+            else:
+                base_value = low_values[i]  # End of burst
+        elif start_rolls[i] < 0.05:
+            base_value = burst_values[i]  # 5% chance to start a burst
+        else:
+            base_value = low_values[i]
+        values[i] = _finish_value(base_value, noise[i], anomalies[i], anomaly_values[i], min_val, max_val)
+
+    return values
+
+
+def _gradual_increase(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                      value_range: float, draws: np.ndarray, noise: np.ndarray, anomalies: np.ndarray,
+                      anomaly_values: np.ndarray) -> np.ndarray:
+    """Memory-like growth, capped at max and occasionally reset (like a service restart)."""
+    # The first point never resets, so its reset draw seeds the starting value instead
+    return _drift_kernel(
+        min_val + value_range * _uniform(0.2, 0.4, draws[1, 0]),
+        value_range * _uniform(0.001, 0.01, draws[0]),
+        min_val + value_range * _uniform(0.1, 0.3, draws[1]),
+        draws[2],
+        min_val,
+        max_val,
+        min_val + value_range * 0.7,
+        True,
+        noise,
+        anomalies,
+        anomaly_values
+    )
+
+
+def _gradual_decrease(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                      value_range: float, draws: np.ndarray, noise: np.ndarray, anomalies: np.ndarray,
+                      anomaly_values: np.ndarray) -> np.ndarray:
+    """Disk-like shrinkage, floored at min and occasionally reset (like disk cleanup)."""
+    # The first point never resets, so its reset draw seeds the starting value instead
+    return _drift_kernel(
+        min_val + value_range * _uniform(0.6, 0.8, draws[1, 0]),
+        -value_range * _uniform(0.001, 0.01, draws[0]),
+        min_val + value_range * _uniform(0.7, 0.9, draws[1]),
+        draws[2],
+        min_val,
+        max_val,
+        min_val + value_range * 0.3,
+        False,
+        noise,
+        anomalies,
+        anomaly_values
+    )
+
+
+def _bursty(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+            value_range: float, draws: np.ndarray, noise: np.ndarray, anomalies: np.ndarray,
+            anomaly_values: np.ndarray) -> np.ndarray:
+    """Mostly low with occasional bursts of activity that random-walk until they end."""
+    return _bursty_kernel(
+        min_val + value_range * _uniform(0.05, 0.2, draws[0]),
+        min_val + value_range * _uniform(0.5, 0.8, draws[1]),
+        value_range * _uniform(-0.1, 0.1, draws[2]),
+        draws[3],
+        draws[4],
+        min_val,
+        max_val,
+        min_val + value_range * 0.5,
+        noise,
+        anomalies,
+        anomaly_values
+    )
+
+
+def _stable_with_spikes(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                        value_range: float, draws: np.ndarray) -> np.ndarray:
+    """Mostly stable with a 10% chance of a spike."""
+    stable_value = min_val + value_range * 0.2
+
+    spikes = draws[0] < 0.1
+    spike_value = min_val + value_range * _uniform(0.3, 0.8, draws[1])
+    stable_noise = value_range * _uniform(-0.05, 0.05, draws[2])
+
+    return np.where(spikes, spike_value, stable_value + stable_noise)
+
 
+def _random_spikes(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                   value_range: float, draws: np.ndarray) -> np.ndarray:
+    """Mostly very low with a 15% chance of a random spike."""
+    spikes = draws[0] < 0.15
+    spike_value = min_val + value_range * _uniform(0.3, 1.0, draws[1])
+    low_value = min_val + value_range * _uniform(0, 0.1, draws[2])
 
-def generate_value(timestamp: int, metric: Dict, last_value: float, host_id: str) -> float:
+    return np.where(spikes, spike_value, low_value)
+
+
+def _correlated_with_cpu(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+                         value_range: float, draws: np.ndarray) -> np.ndarray:
+    """Simulated correlation with CPU usage for the same host."""
+    cpu_like = min_val + value_range * 0.4 * (1 + np.sin(day_progress * 2 * np.pi))
+    noise = value_range * _uniform(-0.1, 0.1, draws[0])
+    return cpu_like + noise
+
+
+def _random(hours: np.ndarray, day_progress: np.ndarray, min_val: float, max_val: float,
+            value_range: float, draws: np.ndarray) -> np.ndarray:
+    """Uniformly random values."""
+    return min_val + value_range * draws[0]
+
+
+# Name, generator function, number of random draw rows and whether the pattern is stateful for
+# each pattern; a metric's pattern_id indexes this list. Stateful patterns build on the last value
+# written, so they also take the noise and anomalies and return the finished series.
+PATTERNS = [
+    ("daily_cycle", _daily_cycle, 1, False),
+    ("gradual_increase", _gradual_increase, 3, True),
+    ("gradual_decrease", _gradual_decrease, 3, True),
+    ("bursty", _bursty, 5, True),
+    ("stable_with_spikes", _stable_with_spikes, 3, False),
+    ("random_spikes", _random_spikes, 3, False),
+    ("correlated_with_cpu", _correlated_with_cpu, 1, False),
+    ("random", _random, 1, False),
+]
+PATTERN_IDS = {name: pattern_id for pattern_id, (name, _, _, _) in enumerate(PATTERNS)}
+
+
+def generate_series(hours: np.ndarray, day_progress: np.ndarray, metric: Dict,
+                    rng: np.random.Generator) -> np.ndarray:
     """
-    Generate a realistic metric value based on the pattern and timestamp.
+    Generate a realistic series of metric values for one host based on the pattern.
 
     Args:
-        timestamp: Unix timestamp
-        metric: Metric configuration dictionary
-        last_value: Previous value for this metric/host
-        host_id: Host identifier
+        hours: Local hour of day (0-23) for each timestamp
+        day_progress: Fraction of the local day elapsed (0.0 to 1.0) for each timestamp
+        metric: Metric configuration dictionary from generate_metrics
+        rng: Random generator to draw from
 
     Returns:
-        A new metric value
+        Array of metric values, one per timestamp
     """
+    # The stateful patterns seed themselves from the first point, so there must be one
+    if len(hours) == 0:
+        return np.empty(0)
+
     min_val = metric["min"]
     max_val = metric["max"]
-    value_range = max_val - min_val
-    pattern = metric["pattern"]
+    value_range = metric["value_range"]
+    _, generate_pattern, pattern_draws, stateful = PATTERNS[metric["pattern_id"]]
+
+    # All the randomness for this series in one call, one contiguous row per use
+    draws = rng.random((pattern_draws + NOISE_DRAWS, len(hours)))
+    noise_draws, anomaly_rolls, direction_rolls, anomaly_draws = draws[-NOISE_DRAWS:]
+
+    # Some noise, and anomalies that either spike up or drop down
+    noise = value_range * _uniform(-0.02, 0.02, noise_draws)
+    anomalies = anomaly_rolls < metric["anomaly_chance"]
+    anomaly_values = np.where(
+        direction_rolls < 0.5,
+        min_val + value_range * _uniform(0.8, 1.2, anomaly_draws),
+        min_val + value_range * _uniform(0, 0.2, anomaly_draws)
+    )
 
-    # Convert timestamp to hour of day (0-23) for daily patterns
-    dt = datetime.datetime.fromtimestamp(timestamp)
-    hour = dt.hour
-    minute = dt.minute
-    day_progress = (hour * 60 + minute) / (24 * 60)  # 0.0 to 1.0
+    # Stateful patterns finish each value before the next one builds on it
+    if stateful:
+        return generate_pattern(hours, day_progress, min_val, max_val, value_range, draws[:-NOISE_DRAWS],
+                                noise, anomalies, anomaly_values)
 
     # Base value depends on the pattern
-    if pattern == "daily_cycle":
-        # Higher during work hours (9am-5pm)
-        if 9 <= hour < 17:
-            # Peak in the middle of the day
-            work_hour = hour - 9  # 0 to 7
-            work_progress = work_hour / 8.0  # 0.0 to 1.0
-            daily_factor = 0.5 + 0.5 * math.sin(math.pi * (work_progress - 0.5))
-            base_value = min_val + value_range * (0.6 + 0.4 * daily_factor)
-        else:
-            # Lower at night with some fluctuation
-            base_value = min_val + value_range * random.uniform(0.1, 0.4)
-
-    elif pattern == "gradual_increase":
-        # If we have a last value, gradually increase it
-        if last_value is not None:
-            # Small increase with some noise
-            change = value_range * random.uniform(0.001, 0.01)
-            base_value = last_value + change
-
-            # Cap at max value, and occasionally reset (like a service restart)
-            if base_value > max_val or (base_value > (min_val + value_range * 0.7) and random.random() < 0.01):
-                base_value = min_val + value_range * random.uniform(0.1, 0.3)
-        else:
-            base_value = min_val + value_range * random.uniform(0.2, 0.4)
+    base_value = generate_pattern(hours, day_progress, min_val, max_val, value_range, draws[:-NOISE_DRAWS])
+    value = np.where(anomalies, anomaly_values, base_value + noise)
 
-    elif pattern == "gradual_decrease":
-        # Similar to increase but decreasing
-        if last_value is not None:
-            change = value_range * random.uniform(0.001, 0.01)
-            base_value = last_value - change
+    # Ensure within bounds
+    np.clip(value, min_val, max_val, out=value)
 
-            # Floor at min value, and occasionally reset (like disk cleanup)
-            if base_value < min_val or (base_value < (min_val + value_range * 0.3) and random.random() < 0.01):
-                base_value = min_val + value_range * random.uniform(0.7, 0.9)
-        else:
-            base_value = min_val + value_range * random.uniform(0.6, 0.8)
+    # Round to 2 decimal places for cleaner data
+    return np.round(value, 2)
 
-    elif pattern == "bursty":
-        # Mostly low with occasional bursts of activity
-        if last_value is not None and last_value > (min_val + value_range * 0.5):
-            # We're in a burst, 80% chance to continue burst
-            if random.random() < 0.8:
-                change = value_range * random.uniform(-0.1, 0.1)
-                base_value = last_value + change
-                base_value = max(min_val, min(max_val, base_value))
-            else:
-                # End of burst
-                base_value = min_val + value_range * random.uniform(0.05, 0.2)
-        else:
-            # Low activity with 5% chance to start a burst
-            if random.random() < 0.05:
-                base_value = min_val + value_range * random.uniform(0.5, 0.8)
-            else:
-                base_value = min_val + value_range * random.uniform(0.05, 0.2)
 
-    elif pattern == "stable_with_spikes":
-        # Mostly stable with occasional spikes
-        stable_value = min_val + value_range * 0.2
+# Inputs shared by every host, set once per worker process by _init_worker
+_worker_inputs: Dict = {}
 
-        # 10% chance of a spike
-        if random.random() < 0.1:
-            spike_height = random.uniform(0.3, 0.8)
-            base_value = min_val + value_range * spike_height
-        else:
-            # Add some noise to the stable value
-            noise = value_range * random.uniform(-0.05, 0.05)
-            base_value = stable_value + noise
-
-    elif pattern == "random_spikes":
-        # Mostly very low with random spikes
-        if random.random() < 0.15:  # 15% chance of a spike
-            base_value = min_val + value_range * random.uniform(0.3, 1.0)
-        else:
-            base_value = min_val + value_range * random.uniform(0, 0.1)
-
-    elif pattern == "correlated_with_cpu":
-        # This would be correlated with CPU usage for the same host
-        # Since we don't have that data here, we'll simulate it
-        cpu_like = min_val + value_range * 0.4 * (1 + math.sin(day_progress * 2 * math.pi))
-        noise = value_range * random.uniform(-0.1, 0.1)
-        base_value = cpu_like + noise
-
-    else:  # default to random
-        base_value = min_val + value_range * random.random()
-
-    # Add some noise
-    noise = value_range * random.uniform(-0.02, 0.02)
-    value = base_value + noise
-
-    # Check for anomalies
-    if random.random() < metric["anomaly_chance"]:
-        # Generate an anomaly
-        if random.random() < 0.5:
-            # Spike up
-            value = min_val + value_range * random.uniform(0.8, 1.2)
-        else:
-            # Drop down
-            value = min_val + value_range * random.uniform(0, 0.2)
 
-    # Ensure within bounds
-    value = max(min_val, min(max_val, value))
+def _init_worker(hours: np.ndarray, day_progress: np.ndarray, metrics: List[Dict]):
+    """
+    Store the inputs shared by every host in the worker process.
 
-    # Round to 2 decimal places for cleaner data
-    return round(value, 2)
+    Under fork they are inherited from the parent rather than pickled, so tasks only carry a
+    host index and seed.
+
+    Args:
+        hours: Local hour of day for each timestamp
+        day_progress: Fraction of the local day elapsed at each timestamp
+        metrics: List of metric configurations
+    """
+    _worker_inputs.update(hours=hours, day_progress=day_progress, metrics=metrics)
+
+
+def _gen_for_host(task: Tuple) -> Tuple[int, np.ndarray]:
+    """
+    Generate every metric series for one host.
+
+    Runs in the worker processes, so it takes a single picklable task tuple.
+
+    Args:
+        task: (host_index, host_seed)
+
+    Returns:
+        The host index and its values laid out as [timestamp, metric]
+    """
+    host_index, host_seed = task
+    hours = _worker_inputs["hours"]
+    day_progress = _worker_inputs["day_progress"]
+    metrics = _worker_inputs["metrics"]
+    rng = np.random.default_rng(host_seed)
+
+    values = np.empty((len(hours), len(metrics)))
+    for metric_index, metric in enumerate(metrics):
+        values[:, metric_index] = generate_series(hours, day_progress, metric, rng)
+
+    return host_index, values
 
 
 def generate_time_series_data(
@@ -421,10 +620,15 @@ def generate_time_series_data(
         end_time: int,
         interval: int,
         metrics: List[Dict],
-        hosts: List[Dict]
-) -> List[Dict]:
+        hosts: List[Dict],
+        seed: int,
+        workers: int = 1
+) -> Dict[str, np.ndarray]:
     """
-    Generate time series data points.
+    Generate time series values for every host and metric.
+
+    Only the values are stored per point; the other columns are expanded batch by batch
+    by iter_data_points when the data is written.
 
     Args:
         start_time: Start timestamp
@@ -432,116 +636,346 @@ def generate_time_series_data(
         interval: Interval between points in seconds
         metrics: List of metric configurations
         hosts: List of host configurations
+        seed: Seed for the value generator
+        workers: Number of processes generating hosts in parallel
 
     Returns:
-        List of data points
+        Dictionary with the timestamps, the values laid out as [timestamp, host, metric], and
+        the customer_id/request_id index used for the high-cardinality metrics at each timestamp
     """
-    data_points = []
+    timestamps = np.arange(start_time, end_time + 1, interval, dtype=np.int64)
+    num_timestamps = len(timestamps)
+
+    # Local hour of day (0-23) and minute of day for daily patterns, using the UTC offset at the start
+    local_timestamps = timestamps + time.localtime(start_time).tm_gmtoff
+    hours = (local_timestamps // 3600) % 24
+    day_progress = ((local_timestamps % 86400) // 60) / (24 * 60)  # 0.0 to 1.0
+
+    # Each host gets its own child seed, so the data doesn't depend on how hosts are spread over workers.
+    # NumPy only takes non-negative seeds; like random.seed, use the absolute value.
+    seed_sequence = np.random.SeedSequence(abs(seed))
+    host_seeds = seed_sequence.spawn(len(hosts))
+
+    # Generate each host/metric series in one shot, hosts spread over the worker processes
+    values = np.empty((num_timestamps, len(hosts), len(metrics)))
+    tasks = list(enumerate(host_seeds))
+    shared_inputs = (hours, day_progress, metrics)
+    if workers > 1:
+        # Fork on Linux so workers inherit the shared inputs instead of unpickling them; elsewhere
+        # keep the platform's default, since fork is unsafe on macOS
+        context = mp.get_context("fork" if sys.platform.startswith("linux") else None)
+        with context.Pool(workers, initializer=_init_worker, initargs=shared_inputs) as pool:
+            chunksize = max(1, len(hosts) // (4 * workers))
+            for host_index, host_values in pool.imap_unordered(_gen_for_host, tasks, chunksize=chunksize):
+                values[:, host_index, :] = host_values
+    else:
+        _init_worker(*shared_inputs)
+        for host_index, host_values in map(_gen_for_host, tasks):
+            values[:, host_index, :] = host_values
+
+    # For high-cardinality metrics, the same customer_id and request_id are used for the same timestamp
+    # Kept in the smallest signed type that also leaves room for the -1 "no tag" marker; drawn as
+    # int32 first, since narrower draws would consume the random stream differently
+    rng = np.random.default_rng(seed_sequence)
+    num_customer_ids = len(TAG_CATEGORIES["customer_id"])
+    num_request_ids = len(TAG_CATEGORIES["request_id"])
+    timestamp_customer_ids = rng.integers(0, num_customer_ids, num_timestamps, dtype=np.int32).astype(
+        np.min_scalar_type(-num_customer_ids))
+    timestamp_request_ids = rng.integers(0, num_request_ids, num_timestamps, dtype=np.int32).astype(
+        np.min_scalar_type(-num_request_ids))
+
+    return {
+        "timestamp": timestamps,
+        "value": values,
+        "customer_id": timestamp_customer_ids,
+        "request_id": timestamp_request_ids,
+    }
 
-    # Keep track of last values for continuity
-    last_values = {}
 
-    # For high-cardinality metrics, we'll create special customer_id maps
-    # This ensures the same customer_id and request_id are used for the same timestamp
-    high_cardinality_maps = {}
+def iter_data_points(data: Dict[str, np.ndarray], metrics: List[Dict], batch_size: int = 100_000):
+    """
+    Yield data points as batches of columns, ordered by timestamp, then host, then metric.
 
-    # Generate data for each timestamp
-    for timestamp in range(start_time, end_time + 1, interval):
+    Metric names, host tags and high-cardinality tag values are given as indices into metrics,
+    hosts and TAG_CATEGORIES; a customer_id/request_id of -1 means the point does not carry
+    that tag.
 
-        # For high-cardinality metrics, prepare a mapping of IDs for this timestamp
-        timestamp_customer_id = random.choice(TAG_CATEGORIES["customer_id"])
-        timestamp_request_id = random.choice(TAG_CATEGORIES["request_id"])
+    Args:
+        data: Generated data from generate_time_series_data
+        metrics: List of metric configurations
+        batch_size: Approximate number of data points per batch
 
-        # For each host
-        for host in hosts:
-            host_id = host["id"]
-            host_tags = host["tags"]
+    Yields:
+        Dictionary of equal-length column arrays: timestamp, metric_id, value, host_id,
+        customer_id and request_id
+    """
+    num_timestamps, num_hosts, num_metrics = data["value"].shape
+    num_series = num_hosts * num_metrics
+
+    # Which metrics carry the special high-cardinality tags
+    has_customer_id = np.array([
+        metric.get("high_cardinality", False) and "customer_id" in metric.get("tag_keys", [])
+        for metric in metrics
+    ])
+    has_request_id = np.array([
+        metric.get("high_cardinality", False) and "request_id" in metric.get("tag_keys", [])
+        for metric in metrics
+    ])
+
+    # Smallest signed index types, which Arrow also accepts as dictionary indices
+    metric_ids = np.arange(num_metrics, dtype=np.min_scalar_type(-num_metrics))
+    host_ids = np.arange(num_hosts, dtype=np.min_scalar_type(-num_hosts))
+
+    # Every batch covers whole timestamps, so the metric/host columns repeat identically
+    batch_timestamps = max(1, batch_size // max(num_series, 1))
+    batch_metric_ids = np.tile(metric_ids, batch_timestamps * num_hosts)
+    batch_host_ids = np.tile(np.repeat(host_ids, num_metrics), batch_timestamps)
+    batch_has_customer_id = np.tile(has_customer_id, batch_timestamps * num_hosts)
+    batch_has_request_id = np.tile(has_request_id, batch_timestamps * num_hosts)
+
+    # Always at least one batch, so writers that take their schema from it still see an empty range
+    for start in range(0, max(num_timestamps, 1), batch_timestamps):
+        chunk = slice(start, start + batch_timestamps)
+        num_points = len(data["timestamp"][chunk]) * num_series
+
+        yield {
+            "timestamp": np.repeat(data["timestamp"][chunk], num_series),
+            "metric_id": batch_metric_ids[:num_points],
+            "value": data["value"][chunk].reshape(num_points),
+            "host_id": batch_host_ids[:num_points],
+            "customer_id": np.where(
+                batch_has_customer_id[:num_points],
+                np.repeat(data["customer_id"][chunk], num_series),
+                -1
+            ),
+            "request_id": np.where(
+                batch_has_request_id[:num_points],
+                np.repeat(data["request_id"][chunk], num_series),
+                -1
+            ),
+        }
+
+
+def _iter_chunks(data: Dict[str, np.ndarray], metrics: List[Dict]):
+    """
+    Yield the data point columns as lists, a batch at a time.
+    """
+    for batch in iter_data_points(data, metrics):
+        yield (
+            batch["timestamp"].tolist(),
+            batch["metric_id"].tolist(),
+            batch["value"].tolist(),
+            batch["host_id"].tolist(),
+            batch["customer_id"].tolist(),
+            batch["request_id"].tolist(),
+        )
+
+
+def _tag_keys(metrics: List[Dict]) -> List[str]:
+    """
+    Sorted tag keys for the output columns, taken from the config rather than the hosts drawn:
+    every host tag category plus the high-cardinality tags of the selected metrics.
+    """
+    tag_keys = {category for category in TAG_CATEGORIES if category not in ("customer_id", "request_id")}
+    for metric in metrics:
+        if metric.get("high_cardinality", False):
+            tag_keys.update(metric.get("tag_keys", []))
 
-            # For each metric
-            for metric in metrics:
-                metric_name = metric["name"]
-                key = f"{host_id}:{metric_name}"
+    # Sort tag keys for consistent columns
+    return sorted(tag_keys)
 
-                # Get last value if available
-                last_value = last_values.get(key)
 
-                # Generate value
-                value = generate_value(timestamp, metric, last_value, host_id)
+def write_csv(data: Dict[str, np.ndarray], metrics: List[Dict], hosts: List[Dict], file_path: str):
+    """
+    Write data points to a CSV file.
 
-                # Store as last value for next iteration
-                last_values[key] = value
+    Args:
+        data: Generated data from generate_time_series_data
+        metrics: List of metric configurations
+        hosts: List of host configurations
+        file_path: Output file path
+    """
+    # Indexed with -1 when a point has no high-cardinality tag; the row format then drops the value
+    customer_ids = np.array(TAG_CATEGORIES["customer_id"], dtype=object)
+    request_ids = np.array(TAG_CATEGORIES["request_id"], dtype=object)
+
+    tag_keys = _tag_keys(metrics)
+
+    # One row format per host/metric series, with the metric name and host tags filled in. Every
+    # format takes (timestamp, value, customer_id, request_id); "%.0s" consumes an unused tag value.
+    row_formats = []
+    for host in hosts:
+        for metric in metrics:
+            high_cardinality_tags = metric.get("tag_keys", []) if metric.get("high_cardinality") else []
+            columns = []
+            for key in tag_keys:
+                if key in ("customer_id", "request_id"):
+                    columns.append("%s" if key in high_cardinality_tags else "%.0s")
+                else:
+                    columns.append(host["tags"].get(key, "").replace("%", "%%"))
+            # Keep the arguments in order when there is no column to take them
+            leading = "" if "customer_id" in tag_keys else "%.0s"
+            trailing = "" if "request_id" in tag_keys else "%.0s"
+            name = metric["name"].replace("%", "%%")
+            row_formats.append("%d," + name + ",%.2f," + leading + ",".join(columns) + trailing + "\n")
+
+    with open(file_path, 'w', buffering=1 << 20) as csvfile:
+        csvfile.write(",".join(["timestamp", "metric", "value"] + tag_keys) + "\n")
+
+        # Format each batch of rows in one list comprehension and write it with a single call
+        for batch in iter_data_points(data, metrics):
+            series = batch["host_id"].astype(np.intp) * len(metrics) + batch["metric_id"]
+            rows = zip(
+                series.tolist(),
+                batch["timestamp"].tolist(),
+                batch["value"].tolist(),
+                customer_ids[batch["customer_id"]].tolist(),
+                request_ids[batch["request_id"]].tolist(),
+            )
+            csvfile.write("".join([
+                row_formats[series_id] % (timestamp, value, customer_id, request_id)
+                for series_id, timestamp, value, customer_id, request_id in rows
+            ]))
+
+
+def _iter_json_chunks(data: Dict[str, np.ndarray], metrics: List[Dict], hosts: List[Dict]):
+    """
+    Yield the data points as lists of compact JSON object strings, a batch at a time.
+
+    Points are formatted straight into a template from JSON fragments prepared once per
+    metric and host, rather than building and serializing a dictionary per point.
+    """
+    def dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
 
-                # Create data point with base tags
-                tags = host_tags.copy()
+    customer_ids = TAG_CATEGORIES["customer_id"]
+    request_ids = TAG_CATEGORIES["request_id"]
+    metric_names = [dumps(metric["name"]) for metric in metrics]
+    host_tags = [dumps(host["tags"]) for host in hosts]
 
-                # For high-cardinality metrics, add special tags
-                if metric.get("high_cardinality", False):
-                    for tag_key in metric.get("tag_keys", []):
-                        if tag_key == "customer_id":
-                            tags["customer_id"] = timestamp_customer_id
-                        elif tag_key == "request_id":
-                            tags["request_id"] = timestamp_request_id
+    for chunk in _iter_chunks(data, metrics):
+        data_points = []
+        append = data_points.append  # Bound once, this loop runs for every data point
+        for timestamp, metric_id, value, host_id, customer_id, request_id in zip(*chunk):
+            tags = host_tags[host_id]
 
-                data_point = {
-                    "timestamp": timestamp,
-                    "metric": metric_name,
-                    "value": value,
-                    "tags": tags
-                }
+            # For high-cardinality metrics, add special tags after the host's
+            if customer_id >= 0 or request_id >= 0:
+                tags = tags[:-1]
+                if customer_id >= 0:
+                    tags += ',"customer_id":"' + customer_ids[customer_id] + '"'
+                if request_id >= 0:
+                    tags += ',"request_id":"' + request_ids[request_id] + '"'
+                tags += "}"
 
-                data_points.append(data_point)
+            append('{"timestamp":%d,"metric":%s,"value":%r,"tags":%s}' % (
+                timestamp, metric_names[metric_id], value, tags
+            ))
 
-    return data_points
+        yield data_points
 
 
-def write_csv(data_points: List[Dict], file_path: str):
+def write_json(data: Dict[str, np.ndarray], metrics: List[Dict], hosts: List[Dict], file_path: str):
     """
-    Write data points to a CSV file.
+    Write data points to a JSON file as a single array.
 
     Args:
-        data_points: List of data point dictionaries
+        data: Generated data from generate_time_series_data
+        metrics: List of metric configurations
+        hosts: List of host configurations
         file_path: Output file path
     """
-    with open(file_path, 'w', newline='') as csvfile:
-        # Extract all possible tag keys
-        tag_keys = set()
-        for point in data_points:
-            tag_keys.update(point["tags"].keys())
+    with open(file_path, 'w', buffering=1 << 20) as jsonfile:
+        jsonfile.write("[")
 
-        # Sort tag keys for consistent columns
-        tag_keys = sorted(tag_keys)
+        for chunk_index, data_points in enumerate(_iter_json_chunks(data, metrics, hosts)):
+            if chunk_index > 0:
+                jsonfile.write(",")
+            jsonfile.write(",".join(data_points))
 
-        # Create CSV field names
-        fieldnames = ["timestamp", "metric", "value"] + tag_keys
+        jsonfile.write("]")
 
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Write each data point
-        for point in data_points:
-            row = {
-                "timestamp": point["timestamp"],
-                "metric": point["metric"],
-                "value": point["value"]
-            }
 
-            # Add tags
-            for key in tag_keys:
-                row[key] = point["tags"].get(key, "")
+def write_ndjson(data: Dict[str, np.ndarray], metrics: List[Dict], hosts: List[Dict], file_path: str):
+    """
+    Write data points to a newline-delimited JSON file, one object per line.
 
-            writer.writerow(row)
+    Args:
+        data: Generated data from generate_time_series_data
+        metrics: List of metric configurations
+        hosts: List of host configurations
+        file_path: Output file path
+    """
+    with open(file_path, 'w', buffering=1 << 20) as jsonfile:
+        for data_points in _iter_json_chunks(data, metrics, hosts):
+            data_points.append("")
+            jsonfile.write("\n".join(data_points))
 
 
-def write_json(data_points: List[Dict], file_path: str):
+def write_parquet(data: Dict[str, np.ndarray], metrics: List[Dict], hosts: List[Dict], file_path: str):
     """
-    Write data points to a JSON file.
+    Write data points to a Parquet file, one row group per million points.
+
+    Metric, host and the other host tags are dictionary encoded; the high-cardinality
+    customer_id and request_id tags are stored as plain strings.
 
     Args:
-        data_points: List of data point dictionaries
+        data: Generated data from generate_time_series_data
+        metrics: List of metric configurations
+        hosts: List of host configurations
         file_path: Output file path
     """
-    with open(file_path, 'w') as jsonfile:
-        json.dump(data_points, jsonfile, indent=2)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet output requires pyarrow (pip install pyarrow)")
+
+    tag_keys = _tag_keys(metrics)
+    metric_names = pa.array([metric["name"] for metric in metrics])
+    host_names = pa.array([host["id"] for host in hosts])
+    high_cardinality_ids = {
+        key: np.array(TAG_CATEGORIES[key], dtype=object) for key in ("customer_id", "request_id")
+    }
+
+    # Index of each host's tag value within its category, -1 where the host lacks the tag
+    host_tag_indices = {
+        key: np.array([host["tags_idx"].get(key, -1) for host in hosts],
+                      dtype=np.min_scalar_type(-len(TAG_CATEGORIES[key])))
+        for key in tag_keys if key not in ("host", "customer_id", "request_id")
+    }
+    dictionary_columns = ["metric", "host"] + list(host_tag_indices)
+
+    writer = None
+    try:
+        for batch in iter_data_points(data, metrics, batch_size=1_000_000):
+            host_ids = batch["host_id"]
+            columns = {
+                "timestamp": pa.array(batch["timestamp"]),
+                "metric": pa.DictionaryArray.from_arrays(batch["metric_id"], metric_names),
+                "value": pa.array(batch["value"]),
+            }
+
+            for key in tag_keys:
+                if key == "host":
+                    columns[key] = pa.DictionaryArray.from_arrays(host_ids, host_names)
+                elif key in high_cardinality_ids:
+                    indices = batch[key]
+                    columns[key] = pa.array(high_cardinality_ids[key][indices], mask=indices < 0)
+                else:
+                    indices = host_tag_indices[key][host_ids]
+                    columns[key] = pa.DictionaryArray.from_arrays(
+                        indices, pa.array(TAG_CATEGORIES[key]), mask=indices < 0
+                    )
+
+            table = pa.table(columns)
+            if writer is None:
+                writer = pq.ParquetWriter(file_path, table.schema, compression='zstd',
+                                          use_dictionary=dictionary_columns)
+            writer.write_table(table, row_group_size=1_000_000)
+    finally:
+        if writer is not None:
+            writer.close()
 
 
 def main():
@@ -554,6 +988,7 @@ def main():
     print(f"Interval: {args.interval} seconds")
     print(f"Metrics: {args.metrics}")
     print(f"Hosts: {args.hosts}")
+    print(f"Workers: {args.workers}")
 
     # Calculate expected data points
     expected_points = ((args.end_time - args.start_time) // args.interval) * args.metrics * args.hosts
@@ -568,15 +1003,17 @@ def main():
     print(f"Generated {len(hosts)} host configurations")
 
     # Generate data points
-    data_points = generate_time_series_data(
+    data = generate_time_series_data(
         args.start_time,
         args.end_time,
         args.interval,
         metrics,
-        hosts
+        hosts,
+        args.seed,
+        min(args.workers, args.hosts)
     )
 
-    num_points = len(data_points)
+    num_points = data["value"].size
     print(f"Generated {num_points} data points")
 
     # Determine output file
@@ -587,9 +1024,13 @@ def main():
 
     # Write output
     if args.output == 'csv':
-        write_csv(data_points, output_file)
+        write_csv(data, metrics, hosts, output_file)
+    elif args.output == 'json':
+        write_json(data, metrics, hosts, output_file)
+    elif args.output == 'ndjson':
+        write_ndjson(data, metrics, hosts, output_file)
     else:
-        write_json(data_points, output_file)
+        write_parquet(data, metrics, hosts, output_file)
 
     print(f"Data written to {output_file}")
 